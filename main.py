@@ -1,63 +1,67 @@
 import argparse
+import dataclasses
+import functools
 import json
 import logging
 import os
 import sys
-import warnings
-
-from langchain_core._api.deprecation import LangChainDeprecationWarning
-from streamlit.web import cli as stcli
 
 from neogpt.settings import config
-from neogpt.builder import builder
-from neogpt.chat import chat_mode
 from neogpt.settings.config import (
-    DEVICE_TYPE,
-    NEOGPT_LOG_FILE,
     import_config,
+    install_warning_filters,
 )
 from neogpt.settings import export_config
-from neogpt.manager import hire, manager
 
+# Argument choices
+_DEVICE_CHOICES = ("cpu", "mps", "cuda")
+_DB_CHOICES = ("Chroma", "FAISS")
+_RETRIEVER_CHOICES = ("local", "web", "hybrid", "stepback", "sql", "compress")
+_PERSONA_CHOICES = (
+    "default",
+    "recruiter",
+    "academician",
+    "friend",
+    "ml_engineer",
+    "ceo",
+    "researcher",
+    "shell",
+)
+_MODEL_TYPE_CHOICES = ("llamacpp", "ollama", "hf", "openai", "lmstudio")
+_MODE_CHOICES = ("llm", "db")
 
-def main():
+
+@functools.lru_cache(1)
+def _build_parser():
+    # The parser is built once per process and reused on later main() calls
     parser = argparse.ArgumentParser(description="NeoGPT CLI Interface")
     parser.add_argument(
         "--device-type",
-        choices=["cpu", "mps", "cuda"],
-        default=DEVICE_TYPE,
-        help="Specify the device type (cpu, mps, cuda)",
+        choices=_DEVICE_CHOICES,
+        default=None,
+        help="Specify the device type (cpu, mps, cuda). Auto-detected if not provided",
     )
     parser.add_argument(
         "--db",
-        choices=["Chroma", "FAISS"],
+        choices=_DB_CHOICES,
         default="Chroma",
         help="Specify the vectorstore (Chroma, FAISS)",
     )
     parser.add_argument(
         "--retriever",
-        choices=["local", "web", "hybrid", "stepback", "sql", "compress"],
+        choices=_RETRIEVER_CHOICES,
         default="local",
         help="Specify the retriever (local, web, hybrid, stepback, sql, compress). It allows you to customize the retriever i.e. how the chatbot should retrieve the documents.",
     )
     parser.add_argument(
         "--persona",
-        choices=[
-            "default",
-            "recruiter",
-            "academician",
-            "friend",
-            "ml_engineer",
-            "ceo",
-            "researcher",
-            "shell",
-        ],
+        choices=_PERSONA_CHOICES,
         default="default",
         help="Specify the persona (default, recruiter). It allows you to customize the persona i.e. how the chatbot should behave.",
     )
     parser.add_argument(
         "--model-type",
-        choices=["llamacpp", "ollama", "hf", "openai", "lmstudio"],
+        choices=_MODEL_TYPE_CHOICES,
         default="llamacpp",
     )
     # TODO: Implement Writer Assistant
@@ -126,8 +130,8 @@ def main():
     parser.add_argument(
         "--temperature",
         type=float,
-        default=config.TEMPERATURE,
-        help=f"The temperature influences the randomness of the generated text. Default is {config.TEMPERATURE}",
+        default=None,
+        help=f"The temperature influences the randomness of the generated text. Default is {config.CONFIG.temperature}",
         # The temperature parameter controls the randomness of predictions by scaling the logits before applying softmax.
         # A higher value makes the output more random, while a lower value makes it more deterministic.
     )
@@ -136,8 +140,8 @@ def main():
     parser.add_argument(
         "--max-tokens",
         type=int,
-        default=config.MAX_TOKEN_LENGTH,
-        help=f"Adjust max tokens to control response length. Default is {config.MAX_TOKEN_LENGTH}",
+        default=None,
+        help=f"Adjust max tokens to control response length. Default is {config.CONFIG.max_token_length}",
         # The max tokens parameter sets the maximum length of the generated text.
         # If the text exceeds this length, it will be cut off.
     )
@@ -146,8 +150,8 @@ def main():
     parser.add_argument(
         "--context-window",
         type=int,
-        default=config.CONTEXT_WINDOW,
-        help=f"Context windows determine the number of tokens considered for context. Default is {config.CONTEXT_WINDOW}",
+        default=None,
+        help=f"Context windows determine the number of tokens considered for context. Default is {config.CONFIG.context_window}",
         # The context windows parameter sets the number of previous tokens to consider as context for the next token prediction.
         # A larger context window allows the model to consider more of the previous text when making predictions.
     )
@@ -171,13 +175,13 @@ def main():
     parser.add_argument(
         "--mode",
         default="db",
-        choices=["llm", "db"],
+        choices=_MODE_CHOICES,
         help="Specify the mode of query",
     )
 
     parser.add_argument(
         "--model",
-        default="llamacpp",
+        default=None,
         help="Specify the model dynamically and overwrite the config settings",
     )
 
@@ -207,12 +211,93 @@ def main():
         help="Enable voice mode",
     )
 
-    args = parser.parse_args()
+    return parser
+
+
+def _setenv_if_changed(key, value):
+    # Skip the putenv() call when the variable already has this value
+    value = str(value)
+    if os.environ.get(key) != value:
+        os.environ[key] = value
+
+
+def _apply_runtime_env(args, overwrite):
+    # Apply the CLI model overrides before any model is loaded
+    # Only arguments the user actually passed override the (imported) config
+    overrides = {}
+    if args.max_tokens is not None:
+        overrides["max_token_length"] = args.max_tokens
+
+    if args.temperature is not None:
+        overrides["temperature"] = args.temperature
+
+    if args.context_window is not None:
+        overrides["context_window"] = args.context_window
+
+    # Parse "<model_type>/<model_name>" once
+    if args.model is not None:
+        model_parts = args.model.split("/", 1)
+        model_type_prefix = model_parts[0]
+        overwrite["MODEL_TYPE"] = model_type_prefix
+        overrides["model_type"] = model_type_prefix
+        if len(model_parts) >= 2:
+            _setenv_if_changed("MODEL_NAME", model_parts[1])
+            overrides["model_name"] = model_parts[1]
+
+    if overrides:
+        config.CONFIG = dataclasses.replace(config.CONFIG, **overrides)
+
+
+def _run_chat(args, overwrite):
+    from neogpt.chat import chat_mode
+
+    chat_mode(
+        device_type=args.device_type or config.DEVICE_TYPE,
+        model_type=overwrite.get("MODEL_TYPE") or args.model_type,
+        persona=overwrite.get("PERSONA") or args.persona,
+        show_source=args.show_source,
+        write=args.write,
+        LOGGING=logging,
+    )
+
+
+def _run_manager(args, overwrite):
+    from neogpt.manager import manager
+
+    manager(
+        device_type=args.device_type or config.DEVICE_TYPE,
+        model_type=overwrite.get("MODEL_TYPE") or args.model_type,
+        vectordb=args.db,
+        retriever=args.retriever,
+        persona=overwrite.get("PERSONA") or args.persona,
+        show_source=args.show_source,
+        write=args.write,
+        interpreter_mode=args.interpreter,
+        shell=args.shell,
+        show_stats=args.stats,
+        LOGGING=logging,
+    )
+
+
+# Query mode (--mode) -> handler
+_HANDLERS = {"llm": _run_chat, "db": _run_manager}
+
+
+def main():
+    args = _build_parser().parse_args()
+    # Supress Langchain Deprecation and torch warnings
+    install_warning_filters()
 
     # This doesn't work as expected need to change it
     if args.import_config:
         config_filename = args.import_config
-        overwrite = import_config(config_filename)
+        config.CONFIG = import_config(config_filename)
+        overwrite = {
+            "PERSONA": config.CONFIG.persona,
+            "UI": config.CONFIG.ui,
+            "VERSION": config.CONFIG.version,
+            "MODEL_TYPE": config.CONFIG.model_type,
+        }
     else:
         overwrite = {
             "PERSONA": args.persona,
@@ -220,20 +305,15 @@ def main():
             "MODEL_TYPE": args.model_type,
         }
         # sys.exit()
+    # Make sure every key used below is present
+    overwrite = {"PERSONA": None, "UI": False, "MODEL_TYPE": None, **overwrite}
     # Doesn't work as expected this is a crappy way to do it quickly need to change it
     if args.export_config:
         config_filename = args.export_config
         export_config(config_filename)
         sys.exit()  # Exit the script after exporting configuration
 
-    if args.max_tokens:
-        config.MAX_TOKEN_LENGTH = args.max_tokens
-
-    if args.temperature:
-        config.TEMPERATURE = args.temperature
-
-    if args.context_window:
-        config.CONTEXT_WINDOW = args.context_window
+    _apply_runtime_env(args, overwrite)
 
     if args.debug:
         log_level = logging.DEBUG
@@ -247,7 +327,7 @@ def main():
         logging.basicConfig(
             format="%(asctime)s - %(levelname)s - %(filename)s:%(lineno)s - %(message)s",
             level=log_level,
-            filename=NEOGPT_LOG_FILE,
+            filename=config.CONFIG.neogpt_log_file,
         )
 
     else:
@@ -256,20 +336,14 @@ def main():
             level=log_level,
         )
 
-    if args.model:
-        model = args.model.split("/", 1)
-        overwrite["MODEL_TYPE"] = model[0]
-        config.MODEL_TYPE = model[0]
-        if len(model) >= 2:
-            os.environ["MODEL_NAME"] = model[1]
-            config.MODEL_NAME = model[1]
-
     # if not os.path.exists(FAISS_PERSIST_DIRECTORY):
     #     builder(vectorstore="FAISS")
 
     # if not os.path.exists(CHROMA_PERSIST_DIRECTORY):
     #     builder(vectorstore="Chroma")
     if args.build:
+        from neogpt.builder import builder
+
         builder(
             vectorstore=args.db,
             recursive=args.recursive,
@@ -277,53 +351,25 @@ def main():
             verbose=args.verbose,
         )
 
-    if args.ui or (overwrite and overwrite["UI"]):
+    if args.ui or overwrite["UI"]:
         logging.info("Starting the UI server for NeoGPT 🤖")
         logging.info("Note: The UI server only supports local retriever and Chroma DB")
+        from streamlit.web import cli as stcli
+
         sys.argv = ["streamlit", "run", "neogpt/ui.py"]
         sys.exit(stcli.main())
 
     elif args.task is not None:
+        from neogpt.manager import hire
+
         hire(
             task=args.task,
             tries=args.tries,
             LOGGING=logging,
         )
 
-    elif args.mode == "llm":
-        chat_mode(
-            device_type=args.device_type,
-            model_type=args.model_type
-            if overwrite["MODEL_TYPE"] is None
-            else overwrite["MODEL_TYPE"],
-            persona=args.persona
-            if overwrite["PERSONA"] is None
-            else overwrite["PERSONA"],
-            show_source=args.show_source,
-            write=args.write,
-            LOGGING=logging,
-        )
     else:
-        manager(
-            device_type=args.device_type,
-            model_type=args.model_type
-            if overwrite["MODEL_TYPE"] is None
-            else overwrite["MODEL_TYPE"],
-            vectordb=args.db,
-            retriever=args.retriever,
-            persona=args.persona
-            if overwrite["PERSONA"] is None
-            else overwrite["PERSONA"],
-            show_source=args.show_source,
-            write=args.write,
-            interpreter_mode=args.interpreter,
-            shell=args.shell,
-            show_stats=args.stats,
-            LOGGING=logging,
-        )
-    # Supress Langchain Deprecation Warnings
-
-    warnings.filterwarnings("ignore", category=LangChainDeprecationWarning)
+        _HANDLERS[args.mode](args, overwrite)
 
 
 if __name__ == "__main__":
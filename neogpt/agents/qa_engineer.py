@@ -6,11 +6,11 @@ from langchain.chains import LLMChain
 from langchain.prompts import PromptTemplate
 from rich import print
 
+from neogpt.settings import config
 from neogpt.settings.config import (
     AGENT_THOUGHTS,
     CURRENT_WORKING_AGENT,
     QA_ENGINEER_FEEDBACK,
-    WORKSPACE_DIRECTORY,
 )
 from neogpt.prompts.agent_prompt import QA_ENGINEER_PROMPT
 
@@ -42,12 +42,13 @@ class QA_Engineer:
         # Check if the file already exists in the workspace directory
         base_filename, extension = os.path.splitext(filename)
         suffix = 1
-        file_path = os.path.join(WORKSPACE_DIRECTORY, filename)
+        workspace_directory = config.CONFIG.workspace_directory
+        file_path = os.path.join(workspace_directory, filename)
 
         while os.path.exists(file_path):
             # If the file exists, append a suffix and construct the new file path
             filename = f"{base_filename}_{suffix}{extension}"
-            file_path = os.path.join(WORKSPACE_DIRECTORY, filename)
+            file_path = os.path.join(workspace_directory, filename)
             suffix += 1
 
         if len(matches) > 0:
@@ -56,7 +57,7 @@ class QA_Engineer:
                 f.write(python_code)
             print(
                 "\n"
-                + f"[bright_yellow]Your task is been writtern to {WORKSPACE_DIRECTORY}/{filename} [/bright_yellow]"
+                + f"[bright_yellow]Your task is been writtern to {workspace_directory}/{filename} [/bright_yellow]"
             )
 
         return code
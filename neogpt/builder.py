@@ -1,7 +1,6 @@
 import argparse
 import logging
 import os
-import re
 from concurrent.futures import ProcessPoolExecutor, as_completed
 from functools import partial  # Import partial
 
@@ -14,19 +13,20 @@ from neogpt.builder_helpers import (
     load_document_batch,
     load_url_batch,
 )
+from neogpt.settings import config
 from neogpt.settings.config import (
-    BUILDER_LOG_FILE,
     DEVICE_TYPE,
-    DOCUMENT_EXTENSION,
-    INGEST_THREADS,
     RESERVED_FILE_NAMES,
-    SOCIAL_CHAT_EXTENSION,
-    SOURCE_DIR,
+    install_warning_filters,
+    is_social_chat,
+    resolve_loader,
 )
 from neogpt.vectorstore import ChromaStore, FAISSStore
 
 
-def build_documents(SOURCE_DIR: str = SOURCE_DIR, recursive: bool = False):
+def build_documents(SOURCE_DIR: str | None = None, recursive: bool = False):
+    if SOURCE_DIR is None:
+        SOURCE_DIR = config.CONFIG.source_dir
     document_paths = []
     chat_paths = []
     url_paths = []
@@ -34,9 +34,10 @@ def build_documents(SOURCE_DIR: str = SOURCE_DIR, recursive: bool = False):
 
     for root, _dirs, files in os.walk(SOURCE_DIR):
         for file in files:
-            extension = os.path.splitext(file)[1]
-            if extension in DOCUMENT_EXTENSION and file not in RESERVED_FILE_NAMES:
-                if any(re.match(pattern, file) for pattern in SOCIAL_CHAT_EXTENSION):
+            extension = os.path.splitext(file)[1].lower()
+            loader_class = resolve_loader(file)
+            if loader_class is not None and file not in RESERVED_FILE_NAMES:
+                if is_social_chat(file):
                     chat_paths.append(os.path.join(root, file))
                 else:
                     document_paths.append(os.path.join(root, file))
@@ -48,7 +49,7 @@ def build_documents(SOURCE_DIR: str = SOURCE_DIR, recursive: bool = False):
                 print("Builder: File type not supported: " + file)
 
     workers = min(
-        INGEST_THREADS,
+        config.CONFIG.ingest_threads,
         max(len(document_paths), 1),
         max(len(url_paths), 1),
         max(len(chat_paths), 1),
@@ -121,13 +122,14 @@ def builder(
         None
     """
 
-    logging.info(f"Loading Documents from {SOURCE_DIR}")
-    documents = build_documents(SOURCE_DIR, recursive)
+    source_dir = config.CONFIG.source_dir
+    logging.info(f"Loading Documents from {source_dir}")
+    documents = build_documents(source_dir, recursive)
     text_splitter = RecursiveCharacterTextSplitter(chunk_size=1000, chunk_overlap=200)
 
     texts = text_splitter.split_documents(documents)
 
-    logging.info(f"Loaded {len(documents)} documents from {SOURCE_DIR}")
+    logging.info(f"Loaded {len(documents)} documents from {source_dir}")
     logging.info(f"Split into {len(texts)} chunks of text")
     logging.info(f"Using {DEVICE_TYPE} device for embedding model")
 
@@ -163,6 +165,7 @@ def builder(
 
 
 if __name__ == "__main__":
+    install_warning_filters()
     parser = argparse.ArgumentParser(description="NeoGPT CLI Interface")
     parser.add_argument(
         "--db",
@@ -194,12 +197,12 @@ if __name__ == "__main__":
             level=logging.INFO,
         )
     elif args.log:
-        if not os.path.exists(BUILDER_LOG_FILE):
-            with open(BUILDER_LOG_FILE, "w"):
+        if not os.path.exists(config.CONFIG.builder_log_file):
+            with open(config.CONFIG.builder_log_file, "w"):
                 pass
 
         logging.basicConfig(
-            filename=BUILDER_LOG_FILE,
+            filename=config.CONFIG.builder_log_file,
             format="%(asctime)s - %(levelname)s - %(filename)s:%(lineno)s - %(message)s",
             level=log_level,
         )
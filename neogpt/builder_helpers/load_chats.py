@@ -1,6 +1,5 @@
 import logging
 import os
-import re
 from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
 
@@ -43,8 +42,8 @@ def load_single_chat(file_path: str) -> Document:
     """
     file_name = os.path.basename(file_path).split(".")[0]
     for pattern, loader_class in SOCIAL_CHAT_EXTENSION.items():
-        if re.match(pattern, file_name):
-            if "whatsapp" in pattern:
+        if pattern.match(file_name):
+            if "whatsapp" in pattern.pattern:
                 loader = loader_class(path=file_path)
                 return process_chat(loader, file_path, "whatsapp")
             else:
@@ -17,7 +17,7 @@ def load_single_document(file_path: str) -> Document:
         Document: Document
     """
     # Loads a single document from a file path
-    file_extension = os.path.splitext(file_path)[1]
+    file_extension = os.path.splitext(file_path)[1].lower()
     loader_class = DOCUMENT_EXTENSION.get(file_extension)
     if loader_class:
         loader = loader_class(file_path)
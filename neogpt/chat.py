@@ -9,14 +9,11 @@ from rich.console import Console
 
 from neogpt.agents import ML_Engineer, QA_Engineer
 from neogpt.callback_handler import AgentCallbackHandler, final_cost
+from neogpt.settings import config
 from neogpt.settings.config import (
     DEVICE_TYPE,
-    MODEL_FILE,
-    MODEL_NAME,
-    MODEL_TYPE,
     QUERY_COST,
     TOTAL_COST,
-    WORKSPACE_DIRECTORY,
 )
 from neogpt.load_llm import load_model
 from neogpt.prompts.prompt import conversation_prompt
@@ -32,18 +29,21 @@ def cprint(*args, **kwargs):
 
 def chat_mode(
     device_type: str = DEVICE_TYPE,
-    model_type: str = MODEL_TYPE,
+    model_type: str | None = None,
     persona: str = "default",
     show_source: bool = False,
     write: str | None = None,
     LOGGING=logging,
 ):
+    if model_type is None:
+        model_type = config.CONFIG.model_type
+
     # Load the LLM model
     llm = load_model(
         device_type,
         model_type,
-        model_id=MODEL_NAME,
-        model_basename=MODEL_FILE,
+        model_id=config.CONFIG.model_name,
+        model_basename=config.CONFIG.model_file,
         LOGGING=logging,
     )
 
@@ -103,13 +103,14 @@ def chat_mode(
 
         # Writing the results to a file if write is specified. It can be used to write assignments, reports etc.
         if write is not None:
-            if not os.path.exists(WORKSPACE_DIRECTORY):
-                os.makedirs(WORKSPACE_DIRECTORY)
+            workspace_directory = config.CONFIG.workspace_directory
+            if not os.path.exists(workspace_directory):
+                os.makedirs(workspace_directory)
 
             base_filename = write
             file_counter = 1
 
-            while os.path.exists(os.path.join(WORKSPACE_DIRECTORY, write)):
+            while os.path.exists(os.path.join(workspace_directory, write)):
                 # If the file already exists, append a counter to the filename
                 write, extension = os.path.splitext(base_filename)
                 write = f"{write}_{file_counter}{extension}"
@@ -117,11 +118,11 @@ def chat_mode(
 
             answer = res["result"]
 
-            with open(os.path.join(WORKSPACE_DIRECTORY, write), "w") as result:
+            with open(os.path.join(workspace_directory, write), "w") as result:
                 result.writelines(answer)
 
             cprint(
-                "\n[lightyellow]Your work is written to {WORKSPACE_DIRECTORY}/{write}[/reset]"
+                f"\n[lightyellow]Your work is written to {workspace_directory}/{write}[/reset]"
             )
 
             break
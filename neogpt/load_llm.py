@@ -17,14 +17,7 @@ from neogpt.callback_handler import (
     StreamlitStreamingHandler,
     TokenCallbackHandler,
 )
-from neogpt.settings.config import (
-    DEVICE_TYPE,
-    MODEL_DIRECTORY,
-    MODEL_FILE,
-    MODEL_NAME,
-    MODEL_TYPE,
-    N_GPU_LAYERS,
-)
+from neogpt.settings.config import DEVICE_TYPE
 
 load_dotenv()
 try:
@@ -43,9 +36,9 @@ def cprint(*args, **kwargs):
 # Function to load the LLM
 def load_model(
     device_type: str = DEVICE_TYPE,
-    model_type: str = MODEL_TYPE,
-    model_id: str = MODEL_NAME,
-    model_basename: str = MODEL_FILE,
+    model_type: str | None = None,
+    model_id: str | None = None,
+    model_basename: str | None = None,
     callback_manager: list | None = None,
     show_stats: bool = False,
     LOGGING=logging,
@@ -55,9 +48,9 @@ def load_model(
     Description: The function loads the LLM model (LLamaCpp, GPTQ, HuggingFacePipeline)
     Args:
         device_type (str, optional): Device type (cpu, mps, cuda). Defaults to DEVICE_TYPE.
-        model_type (str, optional): Model type (mistral, llama, ollama, hf, openai). Defaults to MODEL_TYPE.
-        model_id (str, optional): Model ID. Defaults to MODEL_NAME.
-        model_basename (str, optional): Model basename. Defaults to MODEL_FILE.
+        model_type (str, optional): Model type (mistral, llama, ollama, hf, openai). Defaults to the configured model type.
+        model_id (str, optional): Model ID. Defaults to the configured model name.
+        model_basename (str, optional): Model basename. Defaults to the configured model file.
         callback_manager (list, optional): Callback manager. Defaults to None.
         LOGGING (logging, optional): Logging. Defaults to logging.
     return:
@@ -67,6 +60,13 @@ def load_model(
         llm (ChatOpenAI): Returns a OpenAI object (language model)
         llm (ChatOpenAI): Returns a model from LMStudio
     """
+    # Resolve the defaults from the active configuration at call time
+    model_type = model_type if model_type is not None else config.CONFIG.model_type
+    model_id = model_id if model_id is not None else config.CONFIG.model_name
+    model_basename = (
+        model_basename if model_basename is not None else config.CONFIG.model_file
+    )
+
     callbacks = [StreamingStdOutCallbackHandler()]
     if show_stats:
         callbacks.append(TokenCallbackHandler())
@@ -88,24 +88,25 @@ def load_model(
                 repo_id=model_id,
                 filename=model_basename,
                 resume_download=True,
-                cache_dir=MODEL_DIRECTORY,
+                cache_dir=config.CONFIG.model_directory,
             )
             # Model Parameters
             kwargs = {
                 "model_path": model_path,
-                "max_tokens": config.MAX_TOKEN_LENGTH,
-                "n_ctx": config.CONTEXT_WINDOW,
+                "max_tokens": config.CONFIG.max_token_length,
+                "n_ctx": config.CONFIG.context_window,
                 "n_batch": 512,
                 "callback_manager": callback_manager,
                 "verbose": False,
                 "f16_kv": True,
-                "temperature": config.TEMPERATURE,
+                "temperature": config.CONFIG.temperature,
                 "streaming": True,
             }
             if device_type.lower() == "mps":
                 kwargs["n_gpu_layers"] = -1  # only for MPS devices
             if device_type.lower() == "cuda":
-                kwargs["n_gpu_layers"] = N_GPU_LAYERS  # set this based on your GPU
+                # set this based on your GPU
+                kwargs["n_gpu_layers"] = config.CONFIG.n_gpu_layers
             # Create a LlamaCpp object (language model)
             llm = LlamaCpp(**kwargs)
             cprint(
@@ -123,8 +124,8 @@ def load_model(
             llm = Ollama(
                 base_url="http://localhost:11434",
                 model=model_id,
-                temperature=config.TEMPERATURE,
-                num_ctx=config.CONTEXT_WINDOW,
+                temperature=config.CONFIG.temperature,
+                num_ctx=config.CONFIG.context_window,
                 callback_manager=callback_manager,
             )
             LOGGING.info(f"Loaded {model_id} locally. ")
@@ -144,16 +145,16 @@ def load_model(
             )
             kwargs = {
                 # "temperature": 0,
-                "temperature": config.TEMPERATURE,
-                "max_length": config.MAX_TOKEN_LENGTH,
+                "temperature": config.CONFIG.temperature,
+                "max_length": config.CONFIG.max_token_length,
                 "trust_remote_code": True,
             }
             tokenizer = AutoTokenizer.from_pretrained(
-                model_id, cache_dir=MODEL_DIRECTORY
+                model_id, cache_dir=config.CONFIG.model_directory
             )
             model = AutoModelForCausalLM.from_pretrained(
                 model_id,
-                cache_dir=MODEL_DIRECTORY,
+                cache_dir=config.CONFIG.model_directory,
                 trust_remote_code=True,
             )
             streamer = TextStreamer(tokenizer, skip_prompt=True)
@@ -181,8 +182,8 @@ def load_model(
             llm = ChatOpenAI(
                 model=model_id,
                 api_key=OPENAI_API_KEY,
-                temperature=config.TEMPERATURE,
-                max_tokens=config.MAX_TOKEN_LENGTH,
+                temperature=config.CONFIG.temperature,
+                max_tokens=config.CONFIG.max_token_length,
                 callback_manager=callback_manager,
                 streaming=True,
             )
@@ -200,8 +201,8 @@ def load_model(
             llm = ChatOpenAI(
                 model="local",
                 base_url="http://localhost:1234/v1",
-                temperature=config.TEMPERATURE,
-                max_tokens=config.MAX_TOKEN_LENGTH,
+                temperature=config.CONFIG.temperature,
+                max_tokens=config.CONFIG.max_token_length,
                 streaming=True,
                 callback_manager=callback_manager,
             )
@@ -225,8 +226,8 @@ def load_model(
                 api_key=os.environ.get("TOGETHER_API_KEY"),
                 model=model_id,
                 streaming=True,
-                temperature=config.TEMPERATURE,
-                max_tokens=config.MAX_TOKEN_LENGTH,
+                temperature=config.CONFIG.temperature,
+                max_tokens=config.CONFIG.max_token_length,
                 callback_manager=callback_manager,
                 base_url="https://api.together.xyz",
             )
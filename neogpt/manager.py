@@ -1,10 +1,8 @@
 import logging
 import os
 import re
-import warnings
 from datetime import datetime
 
-from langchain_core._api.deprecation import LangChainDeprecationWarning
 from rich.console import Console
 from rich.prompt import Prompt
 
@@ -15,14 +13,12 @@ from neogpt.callback_handler import (
     TokenCallbackHandler,
     final_cost,
 )
+from neogpt.settings import config
 from neogpt.settings.config import (
     DEVICE_TYPE,
-    MODEL_FILE,
-    MODEL_NAME,
-    MODEL_TYPE,
     QUERY_COST,
     TOTAL_COST,
-    WORKSPACE_DIRECTORY,
+    install_warning_filters,
 )
 from neogpt.load_llm import load_model
 from neogpt.retrievers import (
@@ -48,14 +44,16 @@ def cprint(*args, **kwargs):
 
 def db_retriever(
     device_type: str = DEVICE_TYPE,
-    model_type: str = MODEL_TYPE,
+    model_type: str | None = None,
     vectordb: str = "Chroma",
     retriever: str = "local",
     persona: str = "default",
     show_stats: bool = False,
     LOGGING=logging,
 ):
-    warnings.filterwarnings("ignore", category=LangChainDeprecationWarning)
+    install_warning_filters()
+    if model_type is None:
+        model_type = config.CONFIG.model_type
 
     match vectordb:
         case "Chroma":
@@ -66,14 +64,16 @@ def db_retriever(
             LOGGING.info("Loaded FAISS DB Successfully")
 
     model_name = (
-        os.getenv("MODEL_NAME") if os.getenv("MODEL_NAME") is not None else MODEL_NAME
+        os.getenv("MODEL_NAME")
+        if os.getenv("MODEL_NAME") is not None
+        else config.CONFIG.model_name
     )
 
     llm = load_model(
         device_type=device_type,
         model_type=model_type,
         model_id=model_name,
-        model_basename=MODEL_FILE,
+        model_basename=config.CONFIG.model_file,
         show_stats=show_stats,
         LOGGING=logging,
     )
@@ -149,9 +149,9 @@ def hire(task: str = "", tries: int = 5, LOGGING=logging):
     global TOTAL_COST
     llm = load_model(
         device_type=DEVICE_TYPE,
-        model_type=MODEL_TYPE,
-        model_id=MODEL_NAME,
-        model_basename=MODEL_FILE,
+        model_type=config.CONFIG.model_type,
+        model_id=config.CONFIG.model_name,
+        model_basename=config.CONFIG.model_file,
         callback_manager=[AgentCallbackHandler()],
         show_stats=False,
         LOGGING=LOGGING,
@@ -186,7 +186,7 @@ def shell_():
 
 def manager(
     device_type: str = DEVICE_TYPE,
-    model_type: str = MODEL_TYPE,
+    model_type: str | None = None,
     vectordb: str = "Chroma",
     retriever: str = "local",
     persona: str = "default",
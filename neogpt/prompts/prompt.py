@@ -7,7 +7,7 @@ from langchain.prompts import (
     PromptTemplate,
 )
 
-from neogpt.settings.config import DEFAULT_MEMORY_KEY, MODEL_NAME
+from neogpt.settings import config
 from datetime import datetime
 # The prompts are taken from https://github.com/f/awesome-chatgpt-prompts. Thanks to the author for the amazing work.
 
@@ -48,7 +48,7 @@ PERSONA_PROMPT = {
 
 def get_prompt(
     persona: str = "default",
-    memory_key: int = DEFAULT_MEMORY_KEY,
+    memory_key: int | None = None,
 ):
     """
     Fn: get_prompt
@@ -56,13 +56,17 @@ def get_prompt(
     Args:
         model_type (str, optional): Model type (mistral, gptq). Defaults to "mistral".
         persona (str, optional): Persona (default, recruiter). Defaults to "default".
-        memory_key (int, optional): Memory key. Defaults to DEFAULT_MEMORY_KEY.
+        memory_key (int, optional): Memory key. Defaults to the configured DEFAULT_MEMORY_KEY.
     return:
         prompt (PromptTemplate): Returns a PromptTemplate object
         memory (ConversationBufferWindowMemory): Returns a ConversationBufferWindowMemory object
     #"""
 
-    model_name = os.getenv("MODEL_NAME") if os.getenv("MODEL_NAME") else MODEL_NAME
+    model_name = (
+        os.getenv("MODEL_NAME") if os.getenv("MODEL_NAME") else config.CONFIG.model_name
+    )
+    if memory_key is None:
+        memory_key = config.CONFIG.default_memory_key
 
     memory = ConversationBufferWindowMemory(
         k=memory_key, return_messages=True, input_key="question", memory_key="history"
@@ -261,7 +265,7 @@ def few_shot_prompt():
 def stepback_prompt(
     model_type: str = "mistral",
     persona: str = "default",
-    memory_key: int = DEFAULT_MEMORY_KEY,
+    memory_key: int | None = None,
 ):
     INSTRUCTION_TEMLATE = """
     You are an expert of world knowledge. I am going to ask you a question. Your response should be comprehensive and not contradicted with the following context if they are relevant. Otherwise, ignore them if they are not relevant.
@@ -272,6 +276,8 @@ def stepback_prompt(
     Original Question: {question}
     Answer:
     """
+    if memory_key is None:
+        memory_key = config.CONFIG.default_memory_key
     memory = ConversationBufferWindowMemory(
         k=memory_key, return_messages=True, input_key="question", memory_key="history"
     )
@@ -289,7 +295,7 @@ def stepback_prompt(
 
 def conversation_prompt(
     persona: str = "default",
-    memory_key: int = DEFAULT_MEMORY_KEY,
+    memory_key: int | None = None,
 ):
     prompt, memory = get_prompt(persona=persona, memory_key=memory_key)
     prompt.input_variables.pop(0)
@@ -9,7 +9,7 @@ import os
 from langchain_community.utilities.sql_database import SQLDatabase
 from langchain_experimental.sql import SQLDatabaseChain
 
-from neogpt.settings.config import SOURCE_DIR
+from neogpt.settings import config
 
 
 def sql_retriever(llm, persona):
@@ -21,11 +21,12 @@ def sql_retriever(llm, persona):
     )
 
     # Find any .db file in source dir
-    db_files = [file for file in os.listdir(SOURCE_DIR) if file.endswith(".db")]
+    source_dir = config.CONFIG.source_dir
+    db_files = [file for file in os.listdir(source_dir) if file.endswith(".db")]
     if len(db_files) > 1:
-        raise ValueError(f"More than one .db file found in {SOURCE_DIR}")
+        raise ValueError(f"More than one .db file found in {source_dir}")
 
-    db_file = SOURCE_DIR + "/" + db_files[0]
+    db_file = source_dir + "/" + db_files[0]
     # Load the SQL DB
     db = SQLDatabase.from_uri(f"sqlite:///{db_file}")
     # prompt,memory = get_prompt(persona = persona)
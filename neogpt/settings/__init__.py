@@ -1,6 +1,7 @@
-from neogpt.settings.config import *
+from neogpt.settings import config
 from neogpt.settings.export_config import export_config
 
 __all__ = [
+    "config",
     "export_config",
-]
\ No newline at end of file
+]
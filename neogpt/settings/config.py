@@ -1,46 +1,63 @@
+import dataclasses
+import functools
+import json
 import os
+import re
 import sys
 import warnings
+from dataclasses import dataclass
 from datetime import datetime
 
-import toml
-import torch
 import yaml
-from chromadb.config import Settings
 from dotenv import load_dotenv
-from langchain.chat_loaders.whatsapp import WhatsAppChatLoader
-from langchain.text_splitter import Language
-from langchain_community.document_loaders import (
-    CSVLoader,
-    GutenbergLoader,
-    HNLoader,
-    JSONLoader,
-    PDFMinerLoader,
-    RecursiveUrlLoader,
-    TextLoader,
-    UnstructuredEmailLoader,
-    UnstructuredEPubLoader,
-    UnstructuredExcelLoader,
-    UnstructuredHTMLLoader,
-    UnstructuredMarkdownLoader,
-    UnstructuredPowerPointLoader,
-    UnstructuredTSVLoader,
-    UnstructuredWordDocumentLoader,
-    WebBaseLoader,
-    YoutubeLoader,
-)
 
-# Load Environment Variables
-load_dotenv()
+# Use the libyaml (C) loader/dumper when PyYAML was built with it
+try:
+    from yaml import CSafeDumper as YamlDumper
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeDumper as YamlDumper
+    from yaml import SafeLoader as YamlLoader
 
-# Supress Warnings
-warnings.filterwarnings(
-    "ignore", category=UserWarning, message="TypedStorage is deprecated"
-)
+# Load Environment Variables (only once per process)
+_DOTENV_LOADED = False
+
+
+def _load_env():
+    global _DOTENV_LOADED
+    if not _DOTENV_LOADED:
+        load_dotenv()
+        _DOTENV_LOADED = True
+
+
+_load_env()
+
+# Supress Warnings (installed only once per process)
+_FILTERS_INSTALLED = False
+
+
+def install_warning_filters():
+    global _FILTERS_INSTALLED
+    if _FILTERS_INSTALLED:
+        return
+    from langchain_core._api.deprecation import LangChainDeprecationWarning
 
+    warnings.filterwarnings(
+        "ignore", category=UserWarning, message="TypedStorage is deprecated"
+    )
+    warnings.filterwarnings("ignore", category=LangChainDeprecationWarning)
+    _FILTERS_INSTALLED = True
 
-ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
+# Directory of this module (neogpt/settings), computed once
+_MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(_MODULE_DIR)
+# Settings (YAML config) directory
+_SETTINGS_DIR = _MODULE_DIR
+
+
+# The values below only seed CONFIG; assigning to them at runtime is a no-op.
+# Use dataclasses.replace on config.CONFIG instead.
 
 # Source Directory for Documents to Ingest
 SOURCE_DIR = os.path.join(ROOT_DIR, "documents")
@@ -48,12 +65,6 @@ SOURCE_DIR = os.path.join(ROOT_DIR, "documents")
 MODEL_DIRECTORY = os.path.join(ROOT_DIR, "models")
 # PARENT DB DIRECTORY
 PARENT_DB_DIRECTORY = os.path.join(ROOT_DIR, "db")
-# CHROMA DB DIRECTORY
-CHROMA_PERSIST_DIRECTORY = os.path.join(PARENT_DB_DIRECTORY, "chroma")
-# FAISS DB DIRECTORY
-FAISS_PERSIST_DIRECTORY = os.path.join(PARENT_DB_DIRECTORY, "faiss")
-# PINECONE DB DIRECTORY
-PINECONE_PERSIST_DIRECTORY = os.path.join(PARENT_DB_DIRECTORY, "pinecone")
 # WORKSPACE DIRECTORY
 WORKSPACE_DIRECTORY = os.path.join(ROOT_DIR, "workspace")
 
@@ -89,15 +100,8 @@ N_GPU_LAYERS = 40
 MODEL_TYPE = os.environ.get("MODEL_TYPE", "llamacpp")
 
 # PYTORCH DEVICE COMPATIBILITY
-if torch.cuda.is_available():
-    DEVICE_TYPE = "cuda"
-elif torch.backends.mps.is_available():
-    DEVICE_TYPE = "mps"
-else:
-    DEVICE_TYPE = "cpu"
-
-# CHROMA DB SETTINGS
-CHROMA_SETTINGS = Settings(anonymized_telemetry=False, is_persistent=True)
+# DEVICE_TYPE and CHROMA_SETTINGS are resolved lazily in __getattr__ (see below)
+# so that importing this module does not pull in torch or chromadb.
 
 # PINECONE SETTINGS
 EMBEDDING_DIMENSION = ""
@@ -106,64 +110,103 @@ INDEX_NAME = ""
 # Reserved File Names
 RESERVED_FILE_NAMES = ["builder.url"]
 
-# List of file supported for ingest
-DOCUMENT_EXTENSION = {
-    ".pdf": PDFMinerLoader,
-    ".txt": TextLoader,
-    ".csv": CSVLoader,
-    ".html": UnstructuredHTMLLoader,
-    ".tsv": UnstructuredTSVLoader,
-    ".eml": UnstructuredEmailLoader,
-    ".epub": UnstructuredEPubLoader,
-    ".xls": UnstructuredExcelLoader,
-    ".xlsx": UnstructuredExcelLoader,
-    ".pptx": UnstructuredPowerPointLoader,
-    ".ppt": UnstructuredPowerPointLoader,
-    ".docx": UnstructuredWordDocumentLoader,
-    ".doc": UnstructuredWordDocumentLoader,
-    ".md": UnstructuredMarkdownLoader,
-    ".json": JSONLoader,
-    # ".py": TextLoader,
-}
-
-# List of URL patterns supported for ingest
-URL_EXTENSION = {
-    ".youtube": YoutubeLoader,
-    ".ycombinator": HNLoader,
-    ".gutenberg": GutenbergLoader,
-    "recursive": RecursiveUrlLoader,
-    "normal": WebBaseLoader,
-}
-
-# List of all Social Chat and their loaders
-SOCIAL_CHAT_EXTENSION = {
-    r"^(chat_|_chat|whatsapp_|whatsapp_chat|whatsapp_chat_|whatsapp_)": WhatsAppChatLoader
-}
-
-
-# List of all file extensions for programming languages and their parsers
-CODE_EXTENSION = {
-    ".cpp": Language.CPP,
-    ".go": Language.GO,
-    ".java": Language.JAVA,
-    ".kt": Language.KOTLIN,
-    ".js": Language.JS,
-    ".ts": Language.TS,
-    ".php": Language.PHP,
-    ".proto": Language.PROTO,
-    ".py": Language.PYTHON,
-    ".rst": Language.RST,
-    ".ruby": Language.RUBY,
-    ".rs": Language.RUST,
-    ".scala": Language.SCALA,
-    ".swift": Language.SWIFT,
-    ".markdown": Language.MARKDOWN,
-    ".latex": Language.LATEX,
-    ".html": Language.HTML,
-    ".sol": Language.SOL,
-    ".cs": Language.CSHARP,
-    ".cobol": Language.COBOL,
-}
+
+@functools.lru_cache(1)
+def get_document_extensions():
+    """
+    fn: get_document_extensions
+    Description: Imports the loader classes on demand and builds the extension maps
+    return:
+        dict: Mapping of extension table names to their loaders/parsers
+    """
+    from langchain.chat_loaders.whatsapp import WhatsAppChatLoader
+    from langchain.text_splitter import Language
+    from langchain_community.document_loaders import (
+        CSVLoader,
+        GutenbergLoader,
+        HNLoader,
+        JSONLoader,
+        PDFMinerLoader,
+        RecursiveUrlLoader,
+        TextLoader,
+        UnstructuredEmailLoader,
+        UnstructuredEPubLoader,
+        UnstructuredExcelLoader,
+        UnstructuredHTMLLoader,
+        UnstructuredMarkdownLoader,
+        UnstructuredPowerPointLoader,
+        UnstructuredTSVLoader,
+        UnstructuredWordDocumentLoader,
+        WebBaseLoader,
+        YoutubeLoader,
+    )
+
+    # List of file supported for ingest
+    DOCUMENT_EXTENSION = {
+        ".pdf": PDFMinerLoader,
+        ".txt": TextLoader,
+        ".csv": CSVLoader,
+        ".html": UnstructuredHTMLLoader,
+        ".tsv": UnstructuredTSVLoader,
+        ".eml": UnstructuredEmailLoader,
+        ".epub": UnstructuredEPubLoader,
+        ".xls": UnstructuredExcelLoader,
+        ".xlsx": UnstructuredExcelLoader,
+        ".pptx": UnstructuredPowerPointLoader,
+        ".ppt": UnstructuredPowerPointLoader,
+        ".docx": UnstructuredWordDocumentLoader,
+        ".doc": UnstructuredWordDocumentLoader,
+        ".md": UnstructuredMarkdownLoader,
+        ".json": JSONLoader,
+        # ".py": TextLoader,
+    }
+
+    # List of URL patterns supported for ingest
+    URL_EXTENSION = {
+        ".youtube": YoutubeLoader,
+        ".ycombinator": HNLoader,
+        ".gutenberg": GutenbergLoader,
+        "recursive": RecursiveUrlLoader,
+        "normal": WebBaseLoader,
+    }
+
+    # List of all Social Chat (precompiled file name patterns) and their loaders
+    SOCIAL_CHAT_EXTENSION = {
+        re.compile(
+            r"^(chat_|_chat|whatsapp_|whatsapp_chat|whatsapp_chat_|whatsapp_)"
+        ): WhatsAppChatLoader
+    }
+
+    # List of all file extensions for programming languages and their parsers
+    CODE_EXTENSION = {
+        ".cpp": Language.CPP,
+        ".go": Language.GO,
+        ".java": Language.JAVA,
+        ".kt": Language.KOTLIN,
+        ".js": Language.JS,
+        ".ts": Language.TS,
+        ".php": Language.PHP,
+        ".proto": Language.PROTO,
+        ".py": Language.PYTHON,
+        ".rst": Language.RST,
+        ".ruby": Language.RUBY,
+        ".rs": Language.RUST,
+        ".scala": Language.SCALA,
+        ".swift": Language.SWIFT,
+        ".markdown": Language.MARKDOWN,
+        ".latex": Language.LATEX,
+        ".html": Language.HTML,
+        ".sol": Language.SOL,
+        ".cs": Language.CSHARP,
+        ".cobol": Language.COBOL,
+    }
+
+    return {
+        "DOCUMENT_EXTENSION": DOCUMENT_EXTENSION,
+        "URL_EXTENSION": URL_EXTENSION,
+        "SOCIAL_CHAT_EXTENSION": SOCIAL_CHAT_EXTENSION,
+        "CODE_EXTENSION": CODE_EXTENSION,
+    }
 
 
 # Initial Query Cost and Total Cost
@@ -171,11 +214,7 @@ QUERY_COST = 0
 TOTAL_COST = 0
 
 # LOG CONFIG
-LOG_FOLDER = os.path.join(os.path.dirname(__file__), "logs")
-# BUILDER LOG
-BUILDER_LOG_FILE = os.path.join(LOG_FOLDER, "builder.log")
-# NEOGPT LOG
-NEOGPT_LOG_FILE = os.path.join(LOG_FOLDER, "neogpt.log")
+LOG_FOLDER = os.path.join(_MODULE_DIR, "logs")
 
 # AGENT CONFIG
 PROJECT_COST = 0
@@ -184,68 +223,218 @@ QA_ENGINEER_FEEDBACK = ""
 CURRENT_WORKING_AGENT = ["NeoGPT"]
 
 
-def import_config(config_filename):
-    # This function overwrites the default configuration with the configuration from the config file
-    global \
-        MODEL_NAME, \
-        MODEL_FILE, \
-        EMBEDDING_MODEL, \
-        INGEST_THREADS, \
-        MAX_TOKEN_LENGTH, \
-        N_GPU_LAYERS, \
-        DEFAULT_MEMORY_KEY, \
-        LOG_FOLDER, \
-        SOURCE_DIR, \
-        WORKSPACE_DIRECTORY, \
-        MODEL_DIRECTORY, \
-        PARENT_DB_DIRECTORY, \
-        CHROMA_PERSIST_DIRECTORY, \
-        FAISS_PERSIST_DIRECTORY, \
-        PINECONE_PERSIST_DIRECTORY, \
-        MODEL_TYPE, \
-        TEMPERATURE, \
-        CONTEXT_WINDOW
-
-    SETTINGS_DIR = os.path.join(ROOT_DIR, "settings")
+@dataclass(slots=True, frozen=True)
+class NeoGPTConfig:
+    # Runtime configuration, replaced as a whole by import_config and the CLI overrides
+    model_name: str
+    model_file: str
+    model_type: str
+    embedding_model: str
+    ingest_threads: int
+    max_token_length: int
+    n_gpu_layers: int
+    temperature: float
+    context_window: int
+    default_memory_key: int
+    log_folder: str
+    source_dir: str
+    workspace_directory: str
+    model_directory: str
+    parent_db_directory: str
+    persona: str = "default"
+    ui: bool = False
+    version: str | None = None
+
+    @property
+    def chroma_persist_directory(self):
+        return os.path.join(self.parent_db_directory, "chroma")
+
+    @property
+    def faiss_persist_directory(self):
+        return os.path.join(self.parent_db_directory, "faiss")
+
+    @property
+    def pinecone_persist_directory(self):
+        return os.path.join(self.parent_db_directory, "pinecone")
+
+    @property
+    def builder_log_file(self):
+        return os.path.join(self.log_folder, "builder.log")
+
+    @property
+    def neogpt_log_file(self):
+        return os.path.join(self.log_folder, "neogpt.log")
+
+
+# Active configuration (read it as config.CONFIG so replacements are picked up)
+CONFIG = NeoGPTConfig(
+    model_name=MODEL_NAME,
+    model_file=MODEL_FILE,
+    model_type=MODEL_TYPE,
+    embedding_model=EMBEDDING_MODEL,
+    ingest_threads=INGEST_THREADS,
+    max_token_length=MAX_TOKEN_LENGTH,
+    n_gpu_layers=N_GPU_LAYERS,
+    temperature=TEMPERATURE,
+    context_window=CONTEXT_WINDOW,
+    default_memory_key=DEFAULT_MEMORY_KEY,
+    log_folder=LOG_FOLDER,
+    source_dir=SOURCE_DIR,
+    workspace_directory=WORKSPACE_DIRECTORY,
+    model_directory=MODEL_DIRECTORY,
+    parent_db_directory=PARENT_DB_DIRECTORY,
+)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_yaml(path, mtime_ns, size):
+    # Parsed configs are cached by (path, mtime, size) so unchanged files are not re-parsed
+    # Configs in the settings directory also get a JSON sidecar (<config>.cache), which is
+    # preferred over the YAML when it was built from exactly this version of the file
+    cache_path = path + ".cache"
+    use_sidecar = os.path.dirname(path) == _SETTINGS_DIR
+    if use_sidecar:
+        try:
+            with open(cache_path) as stream:
+                cached = json.loads(stream.read())
+            if cached["mtime_ns"] == mtime_ns and cached["size"] == size:
+                return cached["config"]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+    with open(path) as stream:
+        config = yaml.load(stream, Loader=YamlLoader)
+
+    if use_sidecar:
+        try:
+            serialized = json.dumps(
+                {"mtime_ns": mtime_ns, "size": size, "config": config}
+            )
+            with open(cache_path, "w") as stream:
+                stream.write(serialized)
+        except (OSError, TypeError):
+            pass
+    return config
 
+
+def import_config(config_filename):
+    # This function builds a new NeoGPTConfig from the configuration file
     try:
         if not os.path.isabs(config_filename):
-            config_filename = os.path.join(SETTINGS_DIR, config_filename)
+            config_filename = os.path.join(_SETTINGS_DIR, config_filename)
+        config_filename = os.path.abspath(config_filename)
         print(f"\nUsing configuration file: {config_filename}")
-        with open(config_filename) as stream:
-            try:
-                config = yaml.safe_load(stream)
-            except yaml.YAMLError as exc:
-                print(exc)
-        # MODEL CONFIG
-        MODEL_NAME = config["model"]["MODEL_NAME"]
-        MODEL_FILE = config["model"]["MODEL_FILE"]
-        EMBEDDING_MODEL = config["model"]["EMBEDDING_MODEL"]
-        INGEST_THREADS = config["model"]["INGEST_THREADS"]
-        MAX_TOKEN_LENGTH = config["model"]["MAX_TOKEN_LENGTH"]
-        N_GPU_LAYERS = config["model"]["N_GPU_LAYERS"]
-        TEMPERATURE = config["model"]["TEMPERATURE"]
-        CONTEXT_WINDOW = config["model"]["CONTEXT_WINDOW"]
-        # MODEL TYPE (mistral, openai, hf)
-        MODEL_TYPE = config["neogpt"]["MODEL_TYPE"]
-        # DEFAULT MEMORY KEY FOR CONVERSATION MEMORY (DEFAULT IS 2)
-        DEFAULT_MEMORY_KEY = config["memory"]["DEFAULT_MEMORY_KEY"]
-        LOG_FOLDER = config["logs"]["LOG_FOLDER"]
-        # Directories
-        SOURCE_DIR = config["directories"]["SOURCE_DIR"]
-        WORKSPACE_DIRECTORY = config["directories"]["WORKSPACE_DIRECTORY"]
-        MODEL_DIRECTORY = config["directories"]["MODEL_DIRECTORY"]
-        # Database Directories
-        PARENT_DB_DIRECTORY = config["database"]["PARENT_DB_DIRECTORY"]
+        stat = os.stat(config_filename)
+        config = _load_yaml(config_filename, stat.st_mtime_ns, stat.st_size)
+
+        neogpt, model = config["neogpt"], config["model"]
+        directories = config["directories"]
+        return dataclasses.replace(
+            CONFIG,
+            # MODEL CONFIG
+            model_name=model["MODEL_NAME"],
+            model_file=model["MODEL_FILE"],
+            # MODEL TYPE (mistral, openai, hf), exported under "model"
+            model_type=model.get(
+                "MODEL_TYPE", neogpt.get("MODEL_TYPE", CONFIG.model_type)
+            ),
+            embedding_model=model["EMBEDDING_MODEL"],
+            ingest_threads=model["INGEST_THREADS"],
+            max_token_length=model["MAX_TOKEN_LENGTH"],
+            n_gpu_layers=model["N_GPU_LAYERS"],
+            temperature=model["TEMPERATURE"],
+            context_window=model["CONTEXT_WINDOW"],
+            # DEFAULT MEMORY KEY FOR CONVERSATION MEMORY (DEFAULT IS 2)
+            default_memory_key=config["memory"]["DEFAULT_MEMORY_KEY"],
+            # Directories are exported as names relative to where they live
+            log_folder=os.path.join(_MODULE_DIR, config["logs"]["LOG_FOLDER"]),
+            source_dir=os.path.join(ROOT_DIR, directories["SOURCE_DIR"]),
+            workspace_directory=os.path.join(
+                ROOT_DIR, directories["WORKSPACE_DIRECTORY"]
+            ),
+            model_directory=os.path.join(ROOT_DIR, directories["MODEL_DIRECTORY"]),
+            # Database Directories
+            parent_db_directory=os.path.join(
+                ROOT_DIR, config["database"]["PARENT_DB_DIRECTORY"]
+            ),
+            persona=neogpt["PERSONA"],
+            ui=neogpt["UI"],
+            version=neogpt["VERSION"],
+        )
     except Exception as e:
         print(f"An error occurred: {e}")
-
-    return {
-        "PERSONA": config["neogpt"]["PERSONA"],
-        "UI": config["neogpt"]["UI"],
-        "VERSION": config["neogpt"]["VERSION"],
-        "MODEL_TYPE": config["neogpt"]["MODEL_TYPE"],
-    }
-
-
-
+        return CONFIG
+
+
+@functools.lru_cache(maxsize=1024)
+def resolve_loader(filename):
+    """
+    fn: resolve_loader
+    Description: Finds the loader for a file, checking the social chat patterns for supported documents
+    Args:
+        filename (str): File name or path
+    return:
+        class: Loader class, or None if the file type is not supported
+    """
+    extensions = get_document_extensions()
+    name = os.path.basename(filename)
+    loader_class = extensions["DOCUMENT_EXTENSION"].get(
+        os.path.splitext(name)[1].lower()
+    )
+    if loader_class is None:
+        return None
+    for pattern, chat_loader in extensions["SOCIAL_CHAT_EXTENSION"].items():
+        if pattern.match(name):
+            return chat_loader
+    return loader_class
+
+
+def is_social_chat(filename):
+    """
+    fn: is_social_chat
+    Description: Checks whether a file is a social chat export (e.g. WhatsApp)
+    Args:
+        filename (str): File name or path
+    return:
+        bool: True if the file matches one of the social chat patterns
+    """
+    name = os.path.basename(filename)
+    if resolve_loader(name) is None:
+        return False
+    return any(
+        pattern.match(name)
+        for pattern in get_document_extensions()["SOCIAL_CHAT_EXTENSION"]
+    )
+
+
+@functools.lru_cache(1)
+def _detect_device_type():
+    # Probing CUDA initializes its runtime, so only do it when DEVICE_TYPE is needed
+    import torch
+
+    if torch.cuda.is_available():
+        return "cuda"
+    elif torch.backends.mps.is_available():
+        return "mps"
+    return "cpu"
+
+
+def __getattr__(name):
+    # Lazily resolve the attributes that need heavy imports (PEP 562)
+    if name == "DEVICE_TYPE":
+        value = _detect_device_type()
+    elif name == "CHROMA_SETTINGS":
+        from chromadb.config import Settings
+
+        value = Settings(anonymized_telemetry=False, is_persistent=True)
+    elif name in (
+        "DOCUMENT_EXTENSION",
+        "URL_EXTENSION",
+        "SOCIAL_CHAT_EXTENSION",
+        "CODE_EXTENSION",
+    ):
+        value = get_document_extensions()[name]
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
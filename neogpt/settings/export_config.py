@@ -1,18 +1,31 @@
-
+import functools
+import hashlib
+import json
 import os
+import sys
 from datetime import datetime
 
-import toml
 import yaml
-from neogpt.settings import config
 
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    import toml
+
+    tomllib = None
 
+from neogpt.settings import config
 
 
-# Extract version info from TOML
+# Extract version info from TOML (pyproject.toml doesn't change at runtime)
+@functools.lru_cache(maxsize=4)
 def read_pyproject_toml(file_path):
-    with open(file_path) as toml_file:
-        toml_data = toml.load(toml_file)
+    if tomllib is not None:
+        with open(file_path, "rb") as toml_file:
+            toml_data = tomllib.load(toml_file)
+    else:
+        with open(file_path) as toml_file:
+            toml_data = toml.load(toml_file)
 
     poetry_section = toml_data.get("tool", {}).get("poetry", {})
 
@@ -28,6 +41,57 @@ def read_pyproject_toml(file_path):
     }
 
 
+def _normalize_config_filename(name):
+    # Config files are always saved with a .yaml suffix
+    if not name.endswith(".yaml"):
+        name += ".yaml"
+    return name
+
+
+def _config_path(dirpath, name):
+    # Returns the config file path and whether it already exists
+    filepath = os.path.join(dirpath, _normalize_config_filename(name))
+    return filepath, os.path.exists(filepath)
+
+
+def _resolve_unique_path(dirpath, name):
+    # Returns a config file path that doesn't exist yet, adding a timestamp on collision
+    filepath, exists = _config_path(dirpath, name)
+    if exists:
+        print(f"\nFile {filepath} already exists.")
+        filepath = filepath.removesuffix(".yaml")
+        filepath = f"{filepath}-{datetime.now().strftime('%d-%m-%Y-%H-%M-%S')}.yaml"
+    return filepath
+
+
+def _config_digest(data):
+    # EXPORT_DATE changes on every export, so it is left out of the comparison
+    neogpt = {k: v for k, v in data["neogpt"].items() if k != "EXPORT_DATE"}
+    payload = json.dumps({**data, "neogpt": neogpt}, sort_keys=True)
+    return hashlib.md5(payload.encode(), usedforsecurity=False).hexdigest()
+
+
+def _is_unchanged(filepath, digest):
+    # The digest of the last export is kept in a <config>.hash sidecar, together
+    # with the mtime and size of the file it was written for
+    try:
+        stat = os.stat(filepath)
+        with open(filepath + ".hash") as hash_file:
+            cached = json.loads(hash_file.read())
+        if cached["mtime_ns"] == stat.st_mtime_ns and cached["size"] == stat.st_size:
+            return cached["digest"] == digest
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    # No (or stale) sidecar, compare against the file on disk
+    try:
+        with open(filepath) as file:
+            current = yaml.load(file, Loader=config.YamlLoader)
+        return _config_digest(current) == digest
+    except Exception:
+        return False
+
+
 # Export Configuration
 def export_config(config_filename="settings.yaml"):
     toml_path = "./pyproject.toml"
@@ -36,61 +100,88 @@ def export_config(config_filename="settings.yaml"):
         "neogpt": {
             "VERSION": toml_info["version"],
             "ENV": "development",
-            "PERSONA": "default",
-            "UI": False,
+            "PERSONA": config.CONFIG.persona,
+            "UI": config.CONFIG.ui,
             "EXPORT_DATE": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
             "LICENSE": toml_info["license"],
         },
         "model": {
-            "MODEL_NAME": config.MODEL_NAME,
-            "MODEL_TYPE": config.MODEL_TYPE,
-            "MODEL_FILE": config.MODEL_FILE,
-            "EMBEDDING_MODEL": config.EMBEDDING_MODEL,
-            "INGEST_THREADS": config.INGEST_THREADS,
-            "N_GPU_LAYERS": config.N_GPU_LAYERS,
-            "MAX_TOKEN_LENGTH": config.MAX_TOKEN_LENGTH,
-            "TEMPERATURE": config.TEMPERATURE,
-            "CONTEXT_WINDOW": config.CONTEXT_WINDOW,
+            "MODEL_NAME": config.CONFIG.model_name,
+            "MODEL_TYPE": config.CONFIG.model_type,
+            "MODEL_FILE": config.CONFIG.model_file,
+            "EMBEDDING_MODEL": config.CONFIG.embedding_model,
+            "INGEST_THREADS": config.CONFIG.ingest_threads,
+            "N_GPU_LAYERS": config.CONFIG.n_gpu_layers,
+            "MAX_TOKEN_LENGTH": config.CONFIG.max_token_length,
+            "TEMPERATURE": config.CONFIG.temperature,
+            "CONTEXT_WINDOW": config.CONFIG.context_window,
         },
         "database": {
-            "PARENT_DB_DIRECTORY": os.path.basename(config.PARENT_DB_DIRECTORY),
+            "PARENT_DB_DIRECTORY": os.path.basename(config.CONFIG.parent_db_directory),
         },
         "directories": {
-            "SOURCE_DIR": os.path.basename(config.SOURCE_DIR),
-            "WORKSPACE_DIRECTORY": os.path.basename(config.WORKSPACE_DIRECTORY),
-            "MODEL_DIRECTORY": os.path.basename(config.MODEL_DIRECTORY),
+            "SOURCE_DIR": os.path.basename(config.CONFIG.source_dir),
+            "WORKSPACE_DIRECTORY": os.path.basename(config.CONFIG.workspace_directory),
+            "MODEL_DIRECTORY": os.path.basename(config.CONFIG.model_directory),
         },
         "memory": {
-            "DEFAULT_MEMORY_KEY": config.DEFAULT_MEMORY_KEY,
+            "DEFAULT_MEMORY_KEY": config.CONFIG.default_memory_key,
         },
         "logs": {
-            "LOG_FOLDER": os.path.basename(config.LOG_FOLDER),
+            "LOG_FOLDER": os.path.basename(config.CONFIG.log_folder),
         },
         "pytorch device config": {
             "DEVICE_TYPE": config.DEVICE_TYPE,
         },
     }
 
-    SETTINGS_DIR = os.path.join(config.ROOT_DIR, "settings")
-    if not os.path.exists(SETTINGS_DIR):
-        os.makedirs(SETTINGS_DIR)
-
-    filepath = os.path.join(SETTINGS_DIR, config_filename)
-    if os.path.exists(filepath):
-        overwrite = input(f"\nFile {filepath} already exists. Do you want to overwrite it? (yes/no): ")
-        if overwrite.lower() != "yes":
-            filepath = os.path.join(SETTINGS_DIR, input("Enter a new file name: "))
-            if os.path.exists(filepath) or os.path.exists(str(filepath+".yaml")):
-                print(f"\nFile {filepath} already exists.")
-                filepath = filepath.removesuffix(".yaml")
-                filepath = f'{filepath}-{datetime.now().strftime("%d-%m-%Y-%H-%M-%S")}.yaml'
-            if not filepath.endswith(".yaml"):
-                filepath += ".yaml"
+    SETTINGS_DIR = config._SETTINGS_DIR
+    os.makedirs(SETTINGS_DIR, exist_ok=True)
+
+    filepath, exists = _config_path(SETTINGS_DIR, config_filename)
+    digest = _config_digest(data)
+    if exists and _is_unchanged(filepath, digest):
+        print(f"\nConfiguration unchanged; no write needed ({filepath})")
+        return
+
+    if exists:
+        # Only ask the user when running interactively, never overwrite otherwise
+        if sys.stdin.isatty():
+            overwrite = input(
+                f"\nFile {filepath} already exists. Do you want to overwrite it? (yes/no): "
+            )
+            if overwrite.lower() != "yes":
+                filepath = _resolve_unique_path(
+                    SETTINGS_DIR, input("Enter a new file name: ")
+                )
+        else:
+            filepath = _resolve_unique_path(SETTINGS_DIR, config_filename)
 
     try:
-        with open(filepath, "w") as file:
-            yaml.dump(data, file, sort_keys=False)
-            print(f"\nConfiguration exported to {filepath}")
+        # Serialize in memory first so the file is written with a single call
+        serialized = yaml.dump(
+            data, Dumper=config.YamlDumper, sort_keys=False, default_flow_style=False
+        )
+        with open(filepath, "w", buffering=65536) as file:
+            file.write(serialized)
+        print(f"\nConfiguration exported to {filepath}")
 
     except Exception as e:
         print(f"An error occurred during export: {e}")
+        return
+
+    # The digest sidecar is only an optimization, so failures are ignored
+    try:
+        stat = os.stat(filepath)
+        with open(filepath + ".hash", "w") as hash_file:
+            hash_file.write(
+                json.dumps(
+                    {
+                        "digest": digest,
+                        "mtime_ns": stat.st_mtime_ns,
+                        "size": stat.st_size,
+                    }
+                )
+            )
+    except OSError:
+        pass
@@ -9,12 +9,10 @@ from langchain.schema.document import Document
 from langchain_community.embeddings import HuggingFaceInstructEmbeddings
 from langchain_community.vectorstores.chroma import Chroma
 
+from neogpt.settings import config
 from neogpt.settings.config import (
-    CHROMA_PERSIST_DIRECTORY,
     CHROMA_SETTINGS,
     DEVICE_TYPE,
-    EMBEDDING_MODEL,
-    MODEL_DIRECTORY,
 )
 from neogpt.vectorstore.base import VectorStore
 
@@ -28,12 +26,12 @@ class ChromaStore(VectorStore):
 
     def __init__(self) -> None:
         self.embeddings = HuggingFaceInstructEmbeddings(
-            model_name=EMBEDDING_MODEL,
+            model_name=config.CONFIG.embedding_model,
             model_kwargs={"device": DEVICE_TYPE},
-            cache_folder=MODEL_DIRECTORY,
+            cache_folder=config.CONFIG.model_directory,
         )
         self.chroma = Chroma(
-            persist_directory=CHROMA_PERSIST_DIRECTORY,
+            persist_directory=config.CONFIG.chroma_persist_directory,
             client_settings=CHROMA_SETTINGS,
             embedding_function=self.embeddings,
         )
@@ -42,7 +40,7 @@ class ChromaStore(VectorStore):
         self.chroma.from_documents(
             documents=documents,
             embedding=self.embeddings,
-            persist_directory=CHROMA_PERSIST_DIRECTORY,
+            persist_directory=config.CONFIG.chroma_persist_directory,
             client_settings=CHROMA_SETTINGS,
         )
         return documents
@@ -6,12 +6,8 @@ from langchain.schema.document import Document
 from langchain_community.embeddings import HuggingFaceInstructEmbeddings
 from langchain_community.vectorstores.faiss import FAISS
 
-from neogpt.settings.config import (
-    DEVICE_TYPE,
-    EMBEDDING_MODEL,
-    FAISS_PERSIST_DIRECTORY,
-    MODEL_DIRECTORY,
-)
+from neogpt.settings import config
+from neogpt.settings.config import DEVICE_TYPE
 from neogpt.vectorstore.base import VectorStore
 
 
@@ -24,9 +20,9 @@ class FAISSStore(VectorStore):
 
     def __init__(self) -> None:
         self.embeddings = HuggingFaceInstructEmbeddings(
-            model_name=EMBEDDING_MODEL,
+            model_name=config.CONFIG.embedding_model,
             model_kwargs={"device": DEVICE_TYPE},
-            cache_folder=MODEL_DIRECTORY,
+            cache_folder=config.CONFIG.model_directory,
         )
         self.faiss = FAISS(
             embedding_function=None, index=0, index_to_docstore_id={}, docstore={}
@@ -37,12 +33,12 @@ class FAISSStore(VectorStore):
         self.docstore = self.faiss.from_documents(
             documents=documents, embedding=self.embeddings
         )
-        self.docstore.save_local(FAISS_PERSIST_DIRECTORY)
+        self.docstore.save_local(config.CONFIG.faiss_persist_directory)
         # self.faiss.save_local(FAISS_PERSIST_DIRECTORY)
 
     def load_local(self):
         self.docstore = self.faiss.load_local(
-            folder_path=FAISS_PERSIST_DIRECTORY, embeddings=self.embeddings
+            folder_path=config.CONFIG.faiss_persist_directory, embeddings=self.embeddings
         )
         return self.docstore
 
@@ -51,7 +47,7 @@ class FAISSStore(VectorStore):
 
     def get(self):
         self.docstore = self.faiss.load_local(
-            folder_path=FAISS_PERSIST_DIRECTORY, embeddings=self.embeddings
+            folder_path=config.CONFIG.faiss_persist_directory, embeddings=self.embeddings
         )
         if self.docstore is not None:
             return str(self.docstore)
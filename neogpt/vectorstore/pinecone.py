@@ -6,13 +6,11 @@ from langchain.schema.document import Document
 from langchain_community.embeddings import HuggingFaceInstructEmbeddings
 from pinecone import Pinecone
 
+from neogpt.settings import config
 from neogpt.settings.config import (
     DEVICE_TYPE,
     EMBEDDING_DIMENSION,
-    EMBEDDING_MODEL,
     INDEX_NAME,
-    MODEL_DIRECTORY,
-    PINECONE_PERSIST_DIRECTORY,
 )
 from vectorstore.base import VectorStore
 
@@ -23,14 +21,14 @@ class PineconeVectorStore(VectorStore):
         self.api_key = api_key
         self.environment = environment
         self.embeddings = HuggingFaceInstructEmbeddings(
-            model_name=EMBEDDING_MODEL,
+            model_name=config.CONFIG.embedding_model,
             model_kwargs={"device": DEVICE_TYPE},
-            cache_folder=MODEL_DIRECTORY,
+            cache_folder=config.CONFIG.model_directory,
         )
         self.pinecone_client = Pinecone(
             api_key=api_key,
             environment=environment,
-            persist_directory=PINECONE_PERSIST_DIRECTORY,
+            persist_directory=config.CONFIG.pinecone_persist_directory,
             embedding_dimension=EMBEDDING_DIMENSION,
             index_name=INDEX_NAME,
             embedding_function=self.embeddings,